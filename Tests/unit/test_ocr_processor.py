@@ -7,6 +7,10 @@ Tests core OCR functionality and requirements checking
 import unittest
 import sys
 import os
+import tempfile
+import argparse
+import io
+import contextlib
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -14,48 +18,79 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 try:
-    from processors.ocr_processor import check_requirements, has_text
+    from processors import ocr_processor
+    from processors.ocr_processor import (
+        check_requirements, has_text, group_duplicates, process_directory,
+        cached_scan_pdf, load_text_cache, save_text_cache, ocr_pdf_like_adobe,
+        classify_pdf, redirect_stderr_fd, scan_pdf, PdfInfo, ocr_pdf_fast,
+        positive_int, copy_to_duplicates, ram_tempdir
+    )
 except ImportError as e:
     print(f"Import error: {e}")
     print("Skipping OCR processor tests - module not available")
     sys.exit(0)
 
 
+def fake_ocr_one(pdf_path, mode, ocr_options, info=None):
+    """Picklable stand-in for _ocr_one() in process pool workers"""
+    if Path(pdf_path).name.startswith("bad"):
+        return False, None
+    return True, None
+
+
+def report_omp_thread_limit(pdf_path, mode, ocr_options, info=None):
+    """Picklable stand-in for _ocr_one() that reports the worker's OpenMP limit"""
+    return True, os.environ.get("OMP_THREAD_LIMIT")
+
+
 class TestOCRProcessor(unittest.TestCase):
     """Test core OCR processor functionality"""
 
     def setUp(self):
         """Set up test environment"""
         self.test_pdf_path = Path(__file__).parent.parent / "fixtures" / "document.pdf"
+        # Tesseract lookups are cached per process
+        ocr_processor.find_tesseract.cache_clear()
+        ocr_processor.tesseract_version.cache_clear()
 
+    @patch.dict('os.environ', {}, clear=False)
+    @patch('shutil.which', return_value=os.path.join(os.sep, 'usr', 'bin', 'tesseract'))
     @patch('subprocess.run')
-    def test_check_requirements_tesseract_found(self, mock_run):
+    def test_check_requirements_tesseract_found(self, mock_run, mock_which):
         """Test that check_requirements correctly identifies available Tesseract"""
+        os.environ.pop('TESSERACT_VERSION', None)
         # Mock successful Tesseract version check
         mock_result = Mock()
         mock_result.stdout = "tesseract 4.1.1"
+        mock_result.stderr = ""
         mock_run.return_value = mock_result
         
         # Mock successful ocrmypdf import
         with patch.dict('sys.modules', {'ocrmypdf': Mock()}):
             result = check_requirements()
+            self.assertTrue(check_requirements())
             
         self.assertTrue(result)
-        mock_run.assert_called()
+        # The version probe runs once per process, not once per call
+        mock_run.assert_called_once()
 
+    @patch('shutil.which', return_value=None)
     @patch('subprocess.run')
-    def test_check_requirements_tesseract_not_found(self, mock_run):
+    def test_check_requirements_tesseract_not_found(self, mock_run, mock_which):
         """Test that check_requirements handles missing Tesseract"""
         # Mock FileNotFoundError for all Tesseract paths
         mock_run.side_effect = FileNotFoundError()
         
-        result = check_requirements()
+        with patch.object(ocr_processor, 'TESSERACT_EXTRA_PATHS', ()):
+            result = check_requirements()
         
         self.assertFalse(result)
 
+    @patch('processors.ocr_processor.fitz', None)
     @patch('builtins.open')
+    @patch('mmap.mmap')
     @patch('PyPDF2.PdfReader')
-    def test_has_text_with_searchable_pdf(self, mock_pdf_reader, mock_open):
+    def test_has_text_with_searchable_pdf(self, mock_pdf_reader, mock_mmap, mock_open):
         """Test has_text() correctly identifies searchable PDFs"""
         # Mock PDF with searchable text
         mock_page = Mock()
@@ -69,9 +104,11 @@ class TestOCRProcessor(unittest.TestCase):
         
         self.assertTrue(result)
 
+    @patch('processors.ocr_processor.fitz', None)
     @patch('builtins.open')
+    @patch('mmap.mmap')
     @patch('PyPDF2.PdfReader')
-    def test_has_text_with_scanned_pdf(self, mock_pdf_reader, mock_open):
+    def test_has_text_with_scanned_pdf(self, mock_pdf_reader, mock_mmap, mock_open):
         """Test has_text() correctly identifies scanned PDFs needing OCR"""
         # Mock PDF with no searchable text
         mock_page = Mock()
@@ -85,9 +122,11 @@ class TestOCRProcessor(unittest.TestCase):
         
         self.assertFalse(result)
 
+    @patch('processors.ocr_processor.fitz', None)
     @patch('builtins.open')
+    @patch('mmap.mmap')
     @patch('PyPDF2.PdfReader')
-    def test_has_text_handles_exceptions(self, mock_pdf_reader, mock_open):
+    def test_has_text_handles_exceptions(self, mock_pdf_reader, mock_mmap, mock_open):
         """Test has_text() handles PDF reading exceptions gracefully"""
         # Mock PDF reading exception
         mock_pdf_reader.side_effect = Exception("PDF read error")
@@ -96,6 +135,364 @@ class TestOCRProcessor(unittest.TestCase):
         
         self.assertFalse(result)
 
+    @unittest.skipIf(ocr_processor.fitz is None, "PyMuPDF not installed")
+    def test_has_text_with_pymupdf(self):
+        """Test has_text() reads the fixture's text layer through PyMuPDF"""
+        self.assertTrue(has_text(self.test_pdf_path))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blank_pdf = Path(temp_dir) / "blank.pdf"
+            with ocr_processor.fitz.open() as doc:
+                doc.new_page()
+                doc.save(blank_pdf)
+            self.assertFalse(has_text(blank_pdf))
+
+    @patch('processors.ocr_processor.scan_pdf')
+    def test_cached_scan_pdf_skips_unchanged_files(self, mock_scan_pdf):
+        """Test cached_scan_pdf() only re-scans files that changed"""
+        mock_scan_pdf.return_value = PdfInfo(1, False, False, 'scanned')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "scan.pdf"
+            pdf_path.write_bytes(b"%PDF-1.4 image only")
+            cache_path = Path(temp_dir) / ".ocr_cache.json"
+            
+            seen = {}
+            self.assertEqual(cached_scan_pdf(pdf_path, {}, seen).kind, 'scanned')
+            save_text_cache(cache_path, seen)
+            info = cached_scan_pdf(pdf_path, load_text_cache(cache_path))
+            self.assertEqual(info, PdfInfo(1, False, False, 'scanned'))
+            self.assertEqual(mock_scan_pdf.call_count, 1)
+            
+            pdf_path.write_bytes(b"%PDF-1.4 image only, rescanned")
+            cached_scan_pdf(pdf_path, load_text_cache(cache_path))
+            self.assertEqual(mock_scan_pdf.call_count, 2)
+
+    @patch('processors.ocr_processor.ocr_pdf_like_adobe', return_value=True)
+    @patch('processors.ocr_processor.check_requirements', return_value=True)
+    def test_process_directory_skips_files_that_vanish(self, mock_check, mock_ocr):
+        """Test a PDF deleted after the directory listing does not abort the batch"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gone = Path(temp_dir) / "gone.pdf"
+            scanned = Path(temp_dir) / "scanned.pdf"
+            scanned.write_bytes(b"%PDF-1.4 image only")
+            
+            self.assertIsNone(cached_scan_pdf(gone, {}))
+            with patch.object(Path, 'glob', return_value=iter([gone, scanned])):
+                process_directory(temp_dir)
+        
+        mock_ocr.assert_called_once()
+        self.assertEqual(mock_ocr.call_args.args[0], scanned)
+
+    @patch('processors.ocr_processor.already_ocrd', return_value=True)
+    def test_ocr_skip_mode_leaves_searchable_pdf_alone(self, mock_already_ocrd):
+        """Test ocr_pdf_like_adobe(mode='skip') returns before running OCRmyPDF"""
+        mock_ocrmypdf = Mock()
+        with patch.dict('sys.modules', {'ocrmypdf': mock_ocrmypdf}):
+            result = ocr_pdf_like_adobe(self.test_pdf_path, mode='skip')
+        
+        self.assertTrue(result)
+        mock_ocrmypdf.ocr.assert_not_called()
+        self.assertFalse(self.test_pdf_path.with_suffix('.pdf.backup').exists())
+        
+        with self.assertRaises(ValueError):
+            ocr_pdf_like_adobe(self.test_pdf_path, mode='sometimes')
+
+    def test_ocr_interrupted_leaves_original_in_place(self):
+        """Test an interrupted OCR run never moves or replaces the original"""
+        mock_ocrmypdf = Mock()
+        mock_ocrmypdf.ocr.side_effect = KeyboardInterrupt
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "scan.pdf"
+            pdf_path.write_bytes(self.test_pdf_path.read_bytes())
+            
+            with patch.dict('sys.modules', {'ocrmypdf': mock_ocrmypdf}):
+                with self.assertRaises(KeyboardInterrupt):
+                    ocr_pdf_like_adobe(pdf_path, mode='force')
+            
+            self.assertEqual(pdf_path.read_bytes(), self.test_pdf_path.read_bytes())
+            self.assertEqual([p.name for p in Path(temp_dir).iterdir()], ["scan.pdf"])
+
+    @patch('processors.ocr_processor._tesseract_api')
+    def test_ocr_pdf_fast_leaves_searchable_pdf_alone(self, mock_api):
+        """Test the tesserocr engine never adds a second text layer"""
+        original = self.test_pdf_path.read_bytes()
+        self.assertTrue(ocr_pdf_fast(self.test_pdf_path))
+        self.assertTrue(ocr_pdf_fast(self.test_pdf_path,
+                                     preparsed_info=PdfInfo(1, False, True, 'mixed')))
+        
+        mock_api.assert_not_called()
+        self.assertEqual(self.test_pdf_path.read_bytes(), original)
+
+    @unittest.skipIf(ocr_processor.fitz is None, "PyMuPDF not installed")
+    def test_text_layer_round_trips_non_latin_text(self):
+        """Test the tesserocr text layer extracts exactly what Tesseract recognized"""
+        fitz = ocr_processor.fitz
+        text = "Привет мир Straße 東京 Ελληνικά"
+        # One recognized line at 300 DPI: 2 x 0.5 inches, top-left at (1, 1) inch
+        line = Mock()
+        line.GetUTF8Text.return_value = text + "\n"
+        line.BoundingBox.return_value = (300, 300, 900, 450)
+        tesserocr = Mock()
+        tesserocr.iterate_level.return_value = [line]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "scan.pdf"
+            with fitz.open() as doc:
+                page = doc.new_page()
+                with patch.dict('sys.modules', {'tesserocr': tesserocr}):
+                    ocr_processor._add_text_layer(page, Mock(), 300 / 72)
+                doc.subset_fonts()
+                doc.save(pdf_path)
+            
+            with fitz.open(pdf_path) as doc:
+                self.assertEqual(doc[0].get_text("text").strip(), text)
+                lines = doc[0].get_text("dict")["blocks"][0]["lines"]
+                bbox = fitz.Rect(lines[0]["bbox"])
+        
+        self.assertAlmostEqual(bbox.x0, 72, delta=1)
+        self.assertAlmostEqual(bbox.x1, 216, delta=1)
+
+    @unittest.skipIf(ocr_processor.fitz is None, "PyMuPDF not installed")
+    def test_classify_pdf_digital_vs_scanned(self):
+        """Test classify_pdf() separates born-digital pages from full-page scans"""
+        fitz = ocr_processor.fitz
+        self.assertEqual(classify_pdf(self.test_pdf_path), 'digital')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scanned_pdf = Path(temp_dir) / "scanned.pdf"
+            with fitz.open() as doc:
+                page = doc.new_page()
+                pixmap = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 85, 110), False)
+                pixmap.clear_with(200)
+                page.insert_image(page.rect, pixmap=pixmap)
+                doc.save(scanned_pdf)
+            self.assertEqual(classify_pdf(scanned_pdf), 'scanned')
+            self.assertEqual(scan_pdf(scanned_pdf), PdfInfo(1, False, False, 'scanned'))
+        
+        info = scan_pdf(self.test_pdf_path)
+        self.assertTrue(info.has_text)
+        self.assertEqual(info.kind, 'digital')
+
+    def test_group_duplicates_collapses_identical_files(self):
+        """Test group_duplicates() OCRs byte-identical PDFs only once"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / name for name in ("a.pdf", "b.pdf", "c.pdf", "d.pdf")]
+            paths[0].write_bytes(b"%PDF-1.4 same")
+            paths[1].write_bytes(b"%PDF-1.4 diff")
+            paths[2].write_bytes(b"%PDF-1.4 same")
+            paths[3].write_bytes(b"%PDF-1.4 longer")
+            
+            groups = group_duplicates(paths)
+        
+        self.assertEqual(list(groups), [paths[0], paths[1], paths[3]])
+        self.assertEqual(groups[paths[0]], [paths[2]])
+        self.assertEqual(groups[paths[1]], [])
+
+    def test_copy_to_duplicates_never_truncates_on_failure(self):
+        """Test a failed copy leaves the duplicate intact and no temp file behind"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ocrd = Path(temp_dir) / "a.pdf"
+            duplicate = Path(temp_dir) / "b.pdf"
+            ocrd.write_bytes(b"%PDF-1.4 with text layer")
+            duplicate.write_bytes(b"%PDF-1.4 image only")
+            
+            def disk_full(src, dst, **kwargs):
+                Path(dst).write_bytes(b"%PDF-1.4 wi")
+                raise OSError("No space left on device")
+            
+            with patch('shutil.copyfile', side_effect=disk_full):
+                self.assertEqual(copy_to_duplicates(ocrd, [duplicate]), [duplicate])
+            self.assertEqual(duplicate.read_bytes(), b"%PDF-1.4 image only")
+            self.assertEqual(sorted(p.name for p in Path(temp_dir).iterdir()), ["a.pdf", "b.pdf"])
+            
+            self.assertEqual(copy_to_duplicates(ocrd, [duplicate]), [])
+            self.assertEqual(duplicate.read_bytes(), b"%PDF-1.4 with text layer")
+
+    @patch('processors.ocr_processor.ocr_pdf_like_adobe')
+    @patch('processors.ocr_processor.check_requirements')
+    def test_process_directory_dry_run_writes_nothing(self, mock_check, mock_ocr):
+        """Test process_directory(dry_run=True) never runs OCR or touches files"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scanned = Path(temp_dir) / "scanned.pdf"
+            scanned.write_bytes(b"%PDF-1.4 image only")
+            
+            process_directory(temp_dir, dry_run=True)
+            
+            self.assertEqual(scanned.read_bytes(), b"%PDF-1.4 image only")
+            self.assertEqual(sorted(p.name for p in Path(temp_dir).iterdir()), ["scanned.pdf"])
+        
+        mock_check.assert_not_called()
+        mock_ocr.assert_not_called()
+
+    @patch.dict('os.environ', {}, clear=False)
+    @patch('os.access', return_value=True)
+    @patch('shutil.disk_usage')
+    def test_ram_tempdir_leaves_room_for_every_parallel_file(self, mock_usage, mock_access):
+        """Test /dev/shm is only used when all concurrently OCR'd files fit"""
+        os.environ.pop('TMPDIR', None)
+        mock_usage.return_value = Mock(free=3 << 29)  # 1.5 GiB, room for one file
+        saved = tempfile.tempdir
+        
+        with ram_tempdir(self.test_pdf_path):
+            self.assertEqual(tempfile.tempdir, ocr_processor.RAM_TEMPDIR)
+        self.assertEqual(tempfile.tempdir, saved)
+        with ram_tempdir(self.test_pdf_path, parallel_files=2):
+            self.assertEqual(tempfile.tempdir, saved)
+
+    def test_redirect_stderr_fd_captures_native_writes(self):
+        """Test redirect_stderr_fd catches raw fd 2 writes, not just sys.stderr"""
+        streamed = []
+        with redirect_stderr_fd(max_lines=2, on_line=streamed.append) as lines:
+            os.write(2, b"first\nsecond\nthird\n")
+        
+        self.assertEqual(list(lines), ["second", "third"])
+        self.assertEqual(streamed, ["first", "second", "third"])
+        
+        def broken_callback(line):
+            raise BrokenPipeError
+        
+        # More than a pipe buffer: a dead drain thread would block this write
+        with redirect_stderr_fd(on_line=broken_callback) as lines:
+            os.write(2, (b"x" * 99 + b"\n") * 2000)
+        self.assertEqual(len(lines), 1000)
+
+    def test_ocr_failure_shows_stderr_tail(self):
+        """Test a failed OCR run prints the captured stderr, not just filtered lines"""
+        def failing_ocr(input_file, output_file, **kwargs):
+            os.write(2, b"gs: unrecoverable problem in page 3\n")
+            return 7
+        
+        mock_ocrmypdf = Mock()
+        mock_ocrmypdf.ocr.side_effect = failing_ocr
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "scan.pdf"
+            pdf_path.write_bytes(self.test_pdf_path.read_bytes())
+            
+            output = io.StringIO()
+            with patch.dict('sys.modules', {'ocrmypdf': mock_ocrmypdf}), \
+                    contextlib.redirect_stdout(output):
+                self.assertFalse(ocr_pdf_like_adobe(pdf_path, mode='force'))
+        
+        self.assertIn("Last OCRmyPDF output", output.getvalue())
+        self.assertIn("unrecoverable problem in page 3", output.getvalue())
+
+    @patch.dict('os.environ', {}, clear=False)
+    @patch('os.cpu_count', return_value=8)
+    @patch('processors.ocr_processor.has_text', return_value=True)
+    def test_ocr_options_sent_to_ocrmypdf(self, mock_has_text, mock_cpu_count):
+        """Test fast mode's OCRmyPDF settings and the default per-file job count"""
+        os.environ.pop('TESSERACT_PATH', None)
+        mock_ocrmypdf = Mock()
+        
+        def ocr(input_file, output_file, **kwargs):
+            Path(output_file).write_bytes(Path(input_file).read_bytes())
+            return mock_ocrmypdf.ExitCode.ok
+        
+        mock_ocrmypdf.ocr.side_effect = ocr
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = Path(temp_dir) / "scan.pdf"
+            pdf_path.write_bytes(self.test_pdf_path.read_bytes())
+            
+            with patch.dict('sys.modules', {'ocrmypdf': mock_ocrmypdf}):
+                self.assertTrue(ocr_pdf_like_adobe(pdf_path, mode='force', fast=True,
+                                                   parallel_files=2))
+                fast_options = mock_ocrmypdf.ocr.call_args.kwargs
+                self.assertTrue(ocr_pdf_like_adobe(pdf_path, mode='force'))
+                default_options = mock_ocrmypdf.ocr.call_args.kwargs
+        
+        self.assertEqual({key: fast_options[key] for key in
+                          ('optimize', 'output_type', 'clean', 'deskew')},
+                         {'optimize': 0, 'output_type': 'pdf', 'clean': False, 'deskew': False})
+        self.assertEqual(fast_options['jobs'], 4)
+        self.assertEqual(default_options['optimize'], 3)
+        self.assertEqual(default_options['output_type'], 'pdfa')
+        self.assertTrue(default_options['deskew'])
+        self.assertEqual(default_options['jobs'], 8)
+
+    @patch('processors.ocr_processor.ocr_pdf_like_adobe', return_value=True)
+    @patch('processors.ocr_processor.check_requirements', return_value=True)
+    def test_process_directory_force_and_redo_include_searchable_pdfs(self, mock_check, mock_ocr):
+        """Test force/redo modes OCR PDFs that already have a text layer"""
+        for mode in ('force', 'redo'):
+            mock_ocr.reset_mock()
+            with tempfile.TemporaryDirectory() as temp_dir:
+                searchable = Path(temp_dir) / "document.pdf"
+                searchable.write_bytes(self.test_pdf_path.read_bytes())
+                
+                process_directory(temp_dir, mode=mode)
+            
+            mock_ocr.assert_called_once()
+            self.assertEqual(mock_ocr.call_args.args[0], searchable)
+            self.assertEqual(mock_ocr.call_args.kwargs['mode'], mode)
+
+    @patch('processors.ocr_processor.ocr_pdf_like_adobe', return_value=True)
+    @patch('processors.ocr_processor.check_requirements', return_value=True)
+    def test_process_directory_skips_ocr_producer_pdfs(self, mock_check, mock_ocr):
+        """Test skip mode leaves PDFs tagged by an OCR engine alone, with or without PyMuPDF"""
+        for info in (PdfInfo(1, False, True, 'scanned'), PdfInfo(None, False, True, None)):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                (Path(temp_dir) / "ocrd.pdf").write_bytes(b"%PDF-1.4 image only")
+                with patch('processors.ocr_processor.scan_pdf', return_value=info):
+                    process_directory(temp_dir)
+        
+        mock_ocr.assert_not_called()
+
+    @patch('processors.ocr_processor._ocr_one', fake_ocr_one)
+    def test_iter_ocr_results_process_pool(self):
+        """Test parallel_files > 1 OCRs every file in worker processes"""
+        paths = [Path(f"{name}.pdf") for name in ("a", "bad", "c", "d")]
+        modes = dict.fromkeys(paths, 'force')
+        
+        results = list(ocr_processor._iter_ocr_results(paths, 2, modes, {'language': 'eng'}))
+        
+        self.assertEqual(sorted(results), sorted([
+            (Path("a.pdf"), True, None), (Path("bad.pdf"), False, None),
+            (Path("c.pdf"), True, None), (Path("d.pdf"), True, None),
+        ]))
+
+    @patch('processors.ocr_processor.ocr_pdf_like_adobe')
+    def test_single_file_dry_run_matches_real_run(self, mock_ocr):
+        """Test the single-file preview follows --force-ocr/--redo-ocr and OCR producer tags"""
+        def dry_run(*args):
+            output = io.StringIO()
+            with patch.object(sys, 'argv', ['ocr_processor.py', str(self.test_pdf_path),
+                                            '--dry-run', *args]), \
+                    contextlib.redirect_stdout(output):
+                ocr_processor.main()
+            return output.getvalue()
+        
+        self.assertIn("[DRY RUN] Already searchable", dry_run())
+        self.assertIn("[DRY RUN] Needs OCR (force mode)", dry_run('--force-ocr'))
+        self.assertIn("[DRY RUN] Needs OCR (redo mode)", dry_run('--redo-ocr'))
+        with patch('processors.ocr_processor.scan_pdf',
+                   return_value=PdfInfo(1, False, True, 'scanned')):
+            self.assertIn("[DRY RUN] Already OCR'd", dry_run())
+        mock_ocr.assert_not_called()
+
+    @patch.dict('os.environ', {}, clear=False)
+    def test_only_pool_workers_limit_tesseract_threads(self):
+        """Test OMP_THREAD_LIMIT=1 is set in pool workers, not in this process"""
+        os.environ.pop("OMP_THREAD_LIMIT", None)
+        paths = [Path("a.pdf"), Path("b.pdf")]
+        modes = dict.fromkeys(paths, 'force')
+        
+        with patch('processors.ocr_processor._ocr_one', report_omp_thread_limit):
+            serial = list(ocr_processor._iter_ocr_results(paths, 1, modes, {}))
+            pooled = list(ocr_processor._iter_ocr_results(paths, 2, modes, {}))
+        
+        self.assertEqual([error for _, _, error in serial], [None, None])
+        self.assertEqual([error for _, _, error in pooled], ["1", "1"])
+        self.assertNotIn("OMP_THREAD_LIMIT", os.environ)
+
+    def test_worker_counts_must_be_positive(self):
+        """Test --parallel-files/--ocr-jobs reject zero and negative values"""
+        self.assertEqual(positive_int("3"), 3)
+        for value in ("0", "-1", "two"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                positive_int(value)
+        with self.assertRaises(ValueError):
+            process_directory(".", ocr_jobs=0)
+
     def test_module_imports(self):
         """Test that all required modules can be imported"""
         try:
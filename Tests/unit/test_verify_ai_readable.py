@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for verify_ai_readable.py
+Tests text extraction and content analysis of OCR'd PDFs
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+from datetime import datetime, timezone
+from unittest.mock import patch
+from pathlib import Path
+
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+try:
+    from validators import verify_ai_readable
+    from validators.verify_ai_readable import analyze_content, extract_text_from_pdf, dump_results
+except ImportError as e:
+    print(f"Import error: {e}")
+    print("Skipping verifier tests - module not available")
+    sys.exit(0)
+
+
+# Text layer of samples/scanned_document_OCR.pdf
+SAMPLE_REPORT_TEXT = """--- Page 1 ---
+IMPORTANT BUSINESS DOCUMENT
+Date: November 15, 2024
+To: All Stakeholders
+Subject: Quarterly Performance Report
+This document contains critical information about our
+company's performance in Q3 2024. The following metrics
+demonstrate our continued growth:
+Revenue: $12.5 million (up 23% YoY)
+Customer Base: 45,000 active users
+Market Share: 18.5% in our segment
+Key Achievements:
+- Launched new product line successfully
+- Expanded to 3 new international markets
+- Improved customer satisfaction to 94%
+Future Outlook:
+We project continued growth in Q4 with expected
+revenue of $15 million. Our strategic initiatives
+include Al integration and sustainability programs.
+This information is confidential and should not
+be shared outside the organization.
+Sincerely,
+John Smith
+CEO"""
+
+
+class TestExtractText(unittest.TestCase):
+    """Test extract_text_from_pdf() with each extractor backend"""
+
+    def setUp(self):
+        """Set up test environment"""
+        self.ocr_pdf_path = Path(__file__).parent.parent.parent / "samples" / "scanned_document_OCR.pdf"
+
+    def assert_extracts_sample(self, text):
+        self.assertTrue(text.startswith("--- Page 1 ---\n"))
+        self.assertEqual(analyze_content(text)['dates'], ["November 15, 2024"])
+        self.assertEqual(analyze_content(text)['people'], ["John Smith (CEO)"])
+
+    @unittest.skipIf(verify_ai_readable.fitz is None, "PyMuPDF not installed")
+    def test_extract_with_pymupdf(self):
+        """Test the PyMuPDF backend reads the OCR text layer"""
+        with patch.object(verify_ai_readable, 'pdftotext', None):
+            self.assert_extracts_sample(extract_text_from_pdf(self.ocr_pdf_path))
+
+    def test_extract_with_pypdf2_fallback(self):
+        """Test PyPDF2 is used when neither poppler nor PyMuPDF is installed"""
+        with patch.object(verify_ai_readable, 'pdftotext', None), \
+                patch.object(verify_ai_readable, 'fitz', None):
+            self.assert_extracts_sample(extract_text_from_pdf(self.ocr_pdf_path))
+
+    def test_extract_missing_file_reports_error(self):
+        """Test unreadable files return an ERROR string instead of raising"""
+        self.assertTrue(extract_text_from_pdf("missing.pdf").startswith("ERROR: "))
+
+
+class TestAnalyzeContent(unittest.TestCase):
+    """Test analyze_content() on extracted text"""
+
+    def test_sample_report(self):
+        """Test the sample report yields its labelled metrics, not other figures"""
+        analysis = analyze_content(SAMPLE_REPORT_TEXT)
+
+        self.assertTrue(analysis['readable'])
+        self.assertEqual(analysis['content_found'], [
+            "IMPORTANT BUSINESS DOCUMENT",
+            "Quarterly Performance Report",
+            "Revenue",
+            "Customer Base",
+            "Market Share",
+            "Key Achievements",
+            "Future Outlook",
+        ])
+        self.assertEqual(analysis['business_metrics'], {
+            "Revenue": "$12.5 million",
+            "Customer Base": "45,000 active users",
+            "Market Share": "18.5%",
+        })
+        self.assertEqual(analysis['people'], ["John Smith (CEO)"])
+        self.assertEqual(analysis['dates'], ["November 15, 2024"])
+
+    def test_unlabelled_percentages_are_not_metrics(self):
+        """Test figures such as error rates are not reported as market share"""
+        analysis = analyze_content("Performance Metrics:\n- Error Rate: 0.02%\n- Uptime: 99.98%")
+
+        self.assertEqual(analysis['business_metrics'], {})
+
+    def test_metrics_in_running_text(self):
+        """Test metrics are found when a few words separate label and figure"""
+        for sentence, expected in (
+            ("Revenue increased to $12.5 million", {"Revenue": "$12.5 million"}),
+            ("We serve 45,000 active users", {"Customer Base": "45,000 active users"}),
+            ("Our market share reached 18.5%", {"Market Share": "18.5%"}),
+            ("Revenue grew 23% YoY. We also sold 5 million units", {}),
+        ):
+            with self.subTest(sentence=sentence):
+                self.assertEqual(analyze_content(sentence)['business_metrics'], expected)
+
+    @unittest.skipIf(verify_ai_readable.ahocorasick is None, "pyahocorasick not installed")
+    def test_phrase_automaton_matches_substring_fallback(self):
+        """Test the Aho-Corasick scan finds the same phrases as plain substring checks"""
+        with_automaton = analyze_content(SAMPLE_REPORT_TEXT)
+        with patch.object(verify_ai_readable, '_PHRASE_AUTOMATON', None):
+            without_automaton = analyze_content(SAMPLE_REPORT_TEXT)
+
+        self.assertEqual(with_automaton, without_automaton)
+
+    def test_phrases_match_regardless_of_case(self):
+        """Test key phrases are found in any letter case, short text passes through"""
+        analysis = analyze_content("quarterly PERFORMANCE report / future outlook")
+        self.assertEqual(analysis['content_found'],
+                         ["Quarterly Performance Report", "Future Outlook"])
+
+        short = analyze_content("ok")
+        self.assertTrue(short['readable'])
+        self.assertEqual(short['content_found'], [])
+        self.assertEqual(short['word_count'], 1)
+
+    def test_empty_text_is_not_readable(self):
+        """Test missing text is reported as unreadable"""
+        self.assertFalse(analyze_content(None)['readable'])
+        self.assertFalse(analyze_content("")['readable'])
+
+
+class TestResultsOutput(unittest.TestCase):
+    """Test JSON results output"""
+
+    def test_dump_results_same_with_and_without_orjson(self):
+        """Test orjson and the json fallback produce identical output"""
+        results = {"test_date": datetime(2024, 11, 15, 12, 30, tzinfo=timezone.utc), "words": [1, 2]}
+        with patch.object(verify_ai_readable, 'orjson', None):
+            fallback = dump_results(results)
+
+        self.assertEqual(json.loads(fallback)["test_date"], "2024-11-15T12:30:00Z")
+        if verify_ai_readable.orjson is not None:
+            self.assertEqual(dump_results(results), fallback)
+
+    def test_out_dash_prints_only_json_to_stdout(self):
+        """Test --out - keeps the human-readable report off stdout"""
+        sample = Path(__file__).parent.parent.parent / "samples" / "scanned_document_OCR.pdf"
+        script = Path(verify_ai_readable.__file__)
+        result = subprocess.run(
+            [sys.executable, str(script), '--original', str(sample), '--ocr', str(sample), '--out', '-'],
+            capture_output=True, text=True, check=True)
+
+        results = json.loads(result.stdout)
+        self.assertTrue(results["ocr_pdf"]["readable"])
+        self.assertIn("AI READABILITY VERIFICATION TEST", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
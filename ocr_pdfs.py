@@ -14,15 +14,18 @@ Features:
     - AI-readable output validation
 
 Usage:
-    python ocr_pdfs.py <folder_path>
+    python ocr_pdfs.py <folder_path> [--dry-run] [--parallel-files N] [--ocr-jobs N] [--fast]
     
 Examples:
     python ocr_pdfs.py "C:\\Documents\\PDFs"
     python ocr_pdfs.py "/home/user/scanned-docs"
     python ocr_pdfs.py "."  # Current directory
+    python ocr_pdfs.py "." --dry-run  # Preview without modifying files
+    python ocr_pdfs.py "." --parallel-files 4 --ocr-jobs 2  # 4 PDFs at once
 
 Output:
-    - Original PDFs are backed up with .backup extension
+    - OCR output is written to a temporary file; originals are only replaced
+      once OCR succeeds (a .backup copy is kept if verification fails)
     - Processed PDFs replace originals with searchable versions
     - Processing summary shows success/failure counts
     - Failed files are reported for manual review
@@ -40,14 +43,16 @@ License: MIT
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from processors.ocr_processor import check_requirements, has_text, ocr_pdf_like_adobe
+from processors.ocr_processor import process_directory, positive_int
 
-def process_pdfs(folder_path=None):
+def process_pdfs(folder_path=None, dry_run=False, parallel_files=None, ocr_jobs=None,
+                 fast=False):
     """Process all PDFs in the specified folder"""
     if folder_path:
         target_dir = Path(folder_path)
@@ -59,105 +64,25 @@ def process_pdfs(folder_path=None):
             sys.exit(1)
         target_dir = Path(sys.argv[1])
     
-    print(f"\n{'='*60}")
-    print("OCR PROCESSING - PDF BATCH PROCESSOR")
-    print(f"{'='*60}")
-    print(f"Directory: {target_dir}\n")
-    
-    # Check requirements first
-    if not check_requirements():
-        print("\n[ERROR] Missing requirements. Please install Tesseract OCR.")
-        return
-    
-    # Check if directory exists
-    if not target_dir.exists():
-        print(f"\n[ERROR] Directory not found: {target_dir}")
-        return
-    
-    print("\nScanning for PDFs...\n")
-    
-    # Find all PDFs
-    pdf_files = list(target_dir.glob("*.pdf"))
-    
-    if not pdf_files:
-        print("\n[ERROR] No PDF files found in directory")
-        return
-    
-    print(f"Found {len(pdf_files)} PDF files\n")
-    
-    # Check which PDFs need OCR
-    pdfs_to_process = []
-    already_searchable = []
-    
-    for pdf_file in pdf_files:
-        if pdf_file.name.endswith('.backup'):
-            continue
-            
-        print(f"Checking: {pdf_file.name}...", end=" ")
-        
-        if has_text(pdf_file):
-            print("Already searchable")
-            already_searchable.append(pdf_file)
-        else:
-            print("Needs OCR")
-            pdfs_to_process.append(pdf_file)
-    
-    print(f"\n{'='*60}")
-    print(f"Summary:")
-    print(f"  - Total PDFs: {len(pdf_files)}")
-    print(f"  - Already searchable: {len(already_searchable)}")
-    print(f"  - Need OCR: {len(pdfs_to_process)}")
-    print(f"{'='*60}\n")
-    
-    if not pdfs_to_process:
-        print("All PDFs are already searchable!")
-        return
-    
-    # Process PDFs that need OCR
-    print(f"Starting OCR processing for {len(pdfs_to_process)} PDFs...\n")
-    
-    success_count = 0
-    failed_files = []
-    
-    for i, pdf_path in enumerate(pdfs_to_process, 1):
-        print(f"\n[{i}/{len(pdfs_to_process)}] Processing: {pdf_path.name}")
-        print("-" * 60)
-        
-        try:
-            if ocr_pdf_like_adobe(pdf_path, backup=True, language='eng'):
-                success_count += 1
-                print(f"  [SUCCESS] OCR completed for: {pdf_path.name}")
-            else:
-                failed_files.append(pdf_path.name)
-                print(f"  [FAILED] Could not OCR: {pdf_path.name}")
-        except Exception as e:
-            failed_files.append(pdf_path.name)
-            print(f"  [ERROR] Exception processing {pdf_path.name}: {str(e)}")
-    
-    # Final summary
-    print(f"\n{'='*60}")
-    print("OCR PROCESSING COMPLETE")
-    print(f"{'='*60}")
-    print(f"  - Successfully processed: {success_count}/{len(pdfs_to_process)}")
-    print(f"  - Already searchable: {len(already_searchable)}")
-    print(f"  - Failed: {len(failed_files)}")
-    
-    if failed_files:
-        print("\nFailed files:")
-        for file in failed_files:
-            print(f"  - {file}")
-    
-    print(f"\n{'='*60}")
-    print("All successfully processed PDFs now have searchable text layers!")
-    print("You can search, copy text, and use them with any PDF reader.")
-    print(f"{'='*60}")
+    # Batch logic lives in the processor so both entry points stay in sync
+    process_directory(target_dir, dry_run=dry_run,
+                      parallel_files=parallel_files, ocr_jobs=ocr_jobs, fast=fast)
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR every PDF in a folder that lacks searchable text")
+    parser.add_argument('folder_path', help='Folder containing the PDFs to process')
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Report which PDFs would be OCR'd without modifying any files")
+    parser.add_argument('--parallel-files', type=positive_int, default=None,
+                        help='PDFs to OCR at once in separate processes (default: CPU count // --ocr-jobs, else 1)')
+    parser.add_argument('--ocr-jobs', type=positive_int, default=None,
+                        help='OCRmyPDF workers per file (default: CPU count // --parallel-files)')
+    parser.add_argument('--fast', action='store_true',
+                        help='Skip image optimization, PDF/A conversion and cleanup for speed')
+    args = parser.parse_args()
+    
+    process_pdfs(args.folder_path, dry_run=args.dry_run,
+                 parallel_files=args.parallel_files, ocr_jobs=args.ocr_jobs, fast=args.fast)
 
 if __name__ == "__main__":
-    # Check if folder path provided as argument
-    if len(sys.argv) > 1:
-        process_pdfs()
-    else:
-        print("\nError: No folder path provided!")
-        print("Usage: python ocr_pdfs.py <folder_path>")
-        print("Example: python ocr_pdfs.py \"C:\\Path\\To\\Your\\Folder\"")
-        sys.exit(1)
\ No newline at end of file
+    main()
@@ -8,7 +8,13 @@ Creates searchable PDFs with invisible text layers that are fully AI-readable.
 Main Functions:
     - check_requirements(): Validate OCR toolchain availability
     - has_text(): Check if PDF already contains searchable text
+    - already_ocrd(): Text layer or OCR producer metadata already present
+    - classify_pdf(): Born-digital vs scanned vs mixed, to pick an OCR mode
+    - scan_pdf(): has_text(), OCR producer and classification from one open
+    - cached_scan_pdf(): scan_pdf() backed by a per-directory cache
     - ocr_pdf_like_adobe(): Main OCR processing function
+    - ocr_pdf_fast(): In-process Tesseract OCR for large batches (tesserocr)
+    - group_duplicates(): Collapse byte-identical PDFs so each is OCR'd once
     - process_directory(): Batch processing for multiple files
 
 Usage:
@@ -19,11 +25,17 @@ Usage:
     # Command line
     python ocr_processor.py "input.pdf"
     python ocr_processor.py "C:\\path\\to\\pdfs\\"
+    python ocr_processor.py "C:\\path\\to\\pdfs\\" --dry-run
+    python ocr_processor.py "C:\\path\\to\\pdfs\\" --parallel-files 4 --ocr-jobs 2
+    python ocr_processor.py "C:\\path\\to\\pdfs\\" --fast
+    python ocr_processor.py "C:\\path\\to\\pdfs\\" --engine tesserocr --parallel-files 8
 
 Requirements:
     - OCRmyPDF >= 16.0.0
     - Tesseract OCR >= 4.1.0
     - PyPDF2 >= 3.0.0
+    - PyMuPDF (optional) - much faster text-layer detection than PyPDF2
+    - tesserocr (optional) - in-process Tesseract engine for ocr_pdf_fast()
     - Python >= 3.8
 
 Author: PDF-OCR-Automation Team
@@ -33,37 +45,81 @@ Last Updated: 2025-08-10
 
 import os
 import sys
+import argparse
+import atexit
+import contextlib
 import subprocess
+import threading
+import hashlib
+import json
+import mmap
+import re
+from collections import defaultdict, deque, namedtuple
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 import PyPDF2
 import shutil
+import tempfile
 import importlib.util as importlib_util
 
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # PyMuPDF < 1.24.3
+    except ImportError:
+        fitz = None
+
+# Install locations checked when tesseract is not on PATH
+TESSERACT_EXTRA_PATHS = (
+    r'C:\Program Files\Tesseract-OCR\tesseract.exe',  # Common location
+    r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.environ.get('USERNAME', '')),
+)
+
+@lru_cache(maxsize=1)
+def find_tesseract():
+    """Path to the tesseract executable, or None; looked up without running it"""
+    found = shutil.which('tesseract')
+    if found:
+        return found
+    return next((path for path in TESSERACT_EXTRA_PATHS if Path(path).is_file()), None)
+
+@lru_cache(maxsize=None)
+def tesseract_version(tesseract_path):
+    """
+    First line of `tesseract --version`, or None if it is not Tesseract
+    
+    Runs the binary at most once per process. The result is also stored in
+    TESSERACT_VERSION, so worker processes (which inherit the environment)
+    do not run it again.
+    """
+    if os.environ.get('TESSERACT_VERSION'):
+        return os.environ['TESSERACT_VERSION']
+    try:
+        result = subprocess.run([tesseract_path, '--version'], capture_output=True, text=True)
+    except OSError:
+        return None
+    output = f"{result.stdout or ''}{result.stderr or ''}".strip()
+    if 'tesseract' not in output.lower():
+        return None
+    os.environ['TESSERACT_VERSION'] = output.splitlines()[0]
+    return os.environ['TESSERACT_VERSION']
+
 def check_requirements():
     """Check if Tesseract and ocrmypdf are available"""
     # Check for Tesseract
-    tesseract_paths = [
-        'tesseract',  # In PATH
-        r'C:\Program Files\Tesseract-OCR\tesseract.exe',  # Common location
-        r'C:\Users\{}\AppData\Local\Programs\Tesseract-OCR\tesseract.exe'.format(os.environ.get('USERNAME', ''))
-    ]
-    
-    tesseract_found = False
-    for tesseract_path in tesseract_paths:
-        try:
-            result = subprocess.run([tesseract_path, '--version'], capture_output=True, text=True)
-            if 'tesseract' in result.stdout.lower():
-                print(f"[OK] Tesseract found at: {tesseract_path}")
-                # Set environment variable for ocrmypdf
-                if tesseract_path != 'tesseract':
-                    os.environ['TESSERACT_PATH'] = tesseract_path
-                    # Also add to PATH
-                    tesseract_dir = os.path.dirname(tesseract_path)
-                    os.environ['PATH'] = tesseract_dir + os.pathsep + os.environ.get('PATH', '')
-                tesseract_found = True
-                break
-        except FileNotFoundError:
-            continue
+    tesseract_path = find_tesseract()
+    tesseract_found = bool(tesseract_path and tesseract_version(tesseract_path))
+    if tesseract_found:
+        print(f"[OK] Tesseract found at: {tesseract_path}")
+        if os.path.dirname(tesseract_path) not in os.environ.get('PATH', '').split(os.pathsep):
+            # Set environment variable for ocrmypdf
+            os.environ['TESSERACT_PATH'] = tesseract_path
+            # Also add to PATH
+            tesseract_dir = os.path.dirname(tesseract_path)
+            os.environ['PATH'] = tesseract_dir + os.pathsep + os.environ.get('PATH', '')
     
     if not tesseract_found:
         print("[ERROR] Tesseract is not installed!")
@@ -73,7 +129,7 @@ def check_requirements():
     
     # Check for ocrmypdf
     try:
-        if importlib_util.find_spec('ocrmypdf') is not None:
+        if 'ocrmypdf' in sys.modules or importlib_util.find_spec('ocrmypdf') is not None:
             print("[OK] ocrmypdf is installed")
             return True
         else:
@@ -85,19 +141,401 @@ def check_requirements():
 
 def has_text(pdf_path):
     """Check if PDF already has searchable text"""
+    if fitz is not None:
+        return _has_text_fitz(pdf_path)
+    return _has_text_pypdf2(pdf_path)
+
+def image_coverage(page):
+    """Fraction of a PyMuPDF page's area covered by images (0.0 - 1.0)"""
+    page_area = page.rect.width * page.rect.height
+    if not page_area:
+        return 0.0
+    covered = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info['bbox']) & page.rect
+        covered += bbox.width * bbox.height
+    return min(1.0, covered / page_area)
+
+def _has_text_fitz(pdf_path):
+    """has_text() via PyMuPDF: C-level extraction, no CMap decoding in Python"""
     try:
-        with open(pdf_path, 'rb') as f:
-            reader = PyPDF2.PdfReader(f)
-            text = ""
+        with fitz.open(pdf_path) as doc:
+            chars = 0  # Running count instead of re-concatenating page text
+            for page in doc.pages(0, min(2, doc.page_count)):  # Check first 2 pages
+                page_text = page.get_text("text")
+                chars += len(page_text.strip())
+                if chars > 10:
+                    return True
+                # A full-page image with no text layer is a scan - no need to
+                # look any further
+                if not page_text.strip() and image_coverage(page) > 0.8:
+                    return False
+            return False
+    except Exception:
+        return False
+
+def _has_text_pypdf2(pdf_path):
+    """has_text() fallback used when PyMuPDF is not installed"""
+    try:
+        # Map the file so PyPDF2's xref seeks hit the page cache, not read()
+        with open(pdf_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            reader = PyPDF2.PdfReader(mapped)
+            chars = 0
             for i, page in enumerate(reader.pages):
                 if i >= 2:  # Check first 2 pages
                     break
-                text += page.extract_text()
-            return len(text.strip()) > 10
+                chars += len((page.extract_text() or "").strip())
+                if chars > 10:
+                    return True  # First page is enough - don't parse the second
+            return False
     except Exception:
         return False
 
-def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
+# Per-directory cache of has_text() decisions, keyed on mtime/size/name so
+# unchanged files are not re-parsed on the next run
+TEXT_CACHE_NAME = ".ocr_cache.json"
+TEXT_CACHE_VERSION = 2  # Bump whenever scan_pdf() logic changes
+
+def load_text_cache(cache_path):
+    """Load cached scan_pdf() results, or an empty dict if missing/stale"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != TEXT_CACHE_VERSION:
+        return {}
+    return data.get('entries', {})
+
+def save_text_cache(cache_path, entries):
+    """Write the cache atomically; failures only cost a re-scan next time"""
+    tmp_path = Path(cache_path).with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': TEXT_CACHE_VERSION, 'entries': entries}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[WARNING] Could not save scan cache: {e}")
+
+def cached_scan_pdf(pdf_path, cache, seen=None):
+    """
+    scan_pdf() with a lookup in cache first
+    
+    Args:
+        pdf_path: Path to the PDF
+        cache: Entries from load_text_cache(); new results are added to it
+        seen: Optional dict collecting the entries used in this run, so the
+            saved cache drops files that were changed or deleted
+    
+    Returns:
+        PdfInfo for the file, or None if it cannot be accessed (deleted or
+        locked since the directory was listed)
+    """
+    try:
+        stat = Path(pdf_path).stat()
+    except OSError:
+        return None
+    key = f"{stat.st_mtime_ns}:{stat.st_size}:{Path(pdf_path).name}"
+    entry = cache.get(key)
+    if entry is None:
+        entry = scan_pdf(pdf_path)._asdict()
+        entry['scanned_at'] = datetime.now().isoformat(timespec='seconds')
+        cache[key] = entry
+    if seen is not None:
+        seen[key] = entry
+    return PdfInfo(*(entry[field] for field in PdfInfo._fields))
+
+# Creator/Producer substrings left behind by OCR engines
+OCR_PRODUCER_MARKERS = ('tesseract', 'ocrmypdf', 'abbyy', 'finereader')
+OCR_MODES = ('force', 'skip', 'redo')
+OCR_ENGINES = ('ocrmypdf', 'tesserocr')
+
+def _is_ocr_producer(producer, creator):
+    """True if Producer/Creator strings name a known OCR engine"""
+    tags = f"{producer or ''} {creator or ''}".lower()
+    return any(marker in tags for marker in OCR_PRODUCER_MARKERS)
+
+def has_ocr_producer(pdf_path):
+    """Check the document info for the signature of a known OCR engine"""
+    try:
+        import pikepdf
+        with pikepdf.open(pdf_path) as pdf:
+            docinfo = pdf.docinfo
+            return _is_ocr_producer(docinfo.get('/Producer', ''), docinfo.get('/Creator', ''))
+    except Exception:
+        return False
+
+def already_ocrd(pdf_path):
+    """True if the PDF has a text layer or was produced by an OCR engine"""
+    return has_text(pdf_path) or has_ocr_producer(pdf_path)
+
+# OCR mode for each classify_pdf() result; born-digital files are not OCR'd
+CLASSIFIED_MODES = {'digital': None, 'scanned': 'force', 'mixed': 'redo'}
+
+def classify_pdf(pdf_path, max_pages=3):
+    """
+    Classify a PDF from its first pages by image coverage and text length
+    
+    Returns:
+        'digital' - little image area and real text (image ratio < 0.3,
+            > 50 chars per page); the text can be used as-is
+        'scanned' - pages are images with no text (image ratio > 0.8,
+            <= 10 chars per page); needs a full OCR pass
+        'mixed' - anything in between, e.g. a digital header over a
+            scanned body; suits OCRmyPDF's redo mode
+        None if PyMuPDF is not installed or the file cannot be read
+    """
+    if fitz is None:
+        return None
+    try:
+        with fitz.open(pdf_path) as doc:
+            return _classify(_page_stats(doc, max_pages))
+    except Exception:
+        return None
+
+def _page_stats(doc, max_pages):
+    """(stripped text length, page area, image coverage) of the first pages"""
+    stats = []
+    for page in doc.pages(0, min(max_pages, doc.page_count)):
+        stats.append((len(page.get_text("text").strip()),
+                      page.rect.width * page.rect.height,
+                      image_coverage(page)))
+    return stats
+
+def _classify(stats):
+    """classify_pdf() decision from _page_stats()"""
+    if not stats:
+        return None
+    page_area = sum(area for _, area, _ in stats)
+    image_area = sum(coverage * area for _, area, coverage in stats)
+    image_ratio = image_area / page_area if page_area else 0.0
+    text_per_page = sum(length for length, _, _ in stats) / len(stats)
+    if image_ratio < 0.3 and text_per_page > 50:
+        return 'digital'
+    if image_ratio > 0.8 and text_per_page <= 10:
+        return 'scanned'
+    return 'mixed'
+
+def _text_layer_found(stats):
+    """has_text() decision from _page_stats(): the same rule as _has_text_fitz"""
+    chars = 0
+    for length, _, coverage in stats[:2]:
+        chars += length
+        if chars > 10:
+            return True
+        if not length and coverage > 0.8:
+            return False
+    return False
+
+# What scan_pdf() learned about a file; pages is the total page count
+PdfInfo = namedtuple('PdfInfo', ['pages', 'has_text', 'ocr_producer', 'kind'])
+
+def scan_pdf(pdf_path, max_pages=3):
+    """
+    has_text(), has_ocr_producer() and classify_pdf() from one open of the file
+    
+    The batch scan needs all three answers; asking each function separately
+    parses the same file up to three times. OCRmyPDF cannot take an open
+    document, so the file is still parsed once more if it gets OCR'd.
+    
+    Returns:
+        PdfInfo(pages, has_text, ocr_producer, kind). Without PyMuPDF, pages
+        and kind are None and the producer is only checked for files with
+        no text layer.
+    """
+    if fitz is None:
+        text = has_text(pdf_path)
+        return PdfInfo(None, text, not text and has_ocr_producer(pdf_path), None)
+    try:
+        with fitz.open(pdf_path) as doc:
+            metadata = doc.metadata or {}
+            stats = _page_stats(doc, max_pages)
+            return PdfInfo(doc.page_count, _text_layer_found(stats),
+                           _is_ocr_producer(metadata.get('producer'), metadata.get('creator')),
+                           _classify(stats))
+    except Exception:
+        return PdfInfo(None, False, False, None)
+
+def file_digest(pdf_path, chunk_size=1 << 20):
+    """Return a BLAKE2b digest of the full file contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _safe_digest(pdf_path):
+    try:
+        return file_digest(pdf_path)
+    except OSError:
+        return None
+
+def group_duplicates(pdf_paths):
+    """
+    Group byte-identical PDFs so each distinct document is OCR'd only once
+    
+    Files are bucketed by size first; only files sharing a size are hashed.
+    The whole file is hashed (not sampled) because the OCR output of the
+    representative overwrites its duplicates.
+    
+    Returns:
+        dict mapping each representative path to a list of its duplicates,
+        in the original order of pdf_paths
+    """
+    by_size = defaultdict(list)
+    for pdf_path in pdf_paths:
+        try:
+            by_size[os.path.getsize(pdf_path)].append(pdf_path)
+        except OSError:
+            by_size[None].append(pdf_path)
+    
+    candidates = [p for size, paths in by_size.items()
+                  if size is not None and len(paths) > 1 for p in paths]
+    digests = {}
+    if candidates:
+        # hashlib releases the GIL on large buffers, so threads overlap the reads
+        with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as executor:
+            digests = dict(zip(candidates, executor.map(_safe_digest, candidates)))
+    
+    groups = {}
+    first_by_digest = {}
+    for pdf_path in pdf_paths:
+        digest = digests.get(pdf_path)
+        if digest is not None and digest in first_by_digest:
+            groups[first_by_digest[digest]].append(pdf_path)
+            continue
+        if digest is not None:
+            first_by_digest[digest] = pdf_path
+        groups[pdf_path] = []
+    return groups
+
+def copy_to_duplicates(pdf_path, duplicates):
+    """
+    Copy an OCR'd PDF over its byte-identical duplicates, returning those that failed
+    
+    Each copy goes to a temporary file next to the duplicate and is moved
+    over it with os.replace, so an interrupted copy or a full disk leaves
+    the duplicate as it was instead of truncated.
+    """
+    failed = []
+    for duplicate in duplicates:
+        tmp_path = Path(duplicate).with_suffix('.pdf.ocr-tmp')
+        try:
+            shutil.copy2(pdf_path, tmp_path)
+            os.replace(tmp_path, duplicate)
+            print(f"  [DUPLICATE] Reused OCR output for: {Path(duplicate).name}")
+        except OSError as e:
+            failed.append(duplicate)
+            print(f"  [ERROR] Could not update duplicate {Path(duplicate).name}: {e}")
+        finally:
+            # Also runs on Ctrl+C; a finished copy has already been moved
+            if tmp_path.exists():
+                tmp_path.unlink()
+    return failed
+
+@contextlib.contextmanager
+def redirect_stderr_fd(max_lines=1000, on_line=None):
+    """
+    Capture everything written to file descriptor 2 while the block runs.
+    
+    Swapping sys.stderr only catches Python writes; Tesseract, Ghostscript
+    and other child processes inherit fd 2 and print straight to the
+    console. Pointing fd 2 at a pipe catches both. A background thread
+    drains the pipe so a chatty child never blocks on a full pipe, and
+    only the last max_lines lines are kept.
+    
+    on_line, if given, is called from the drain thread with each line as it
+    arrives. It must not write to stderr, which is the pipe being drained.
+    Exceptions from it are ignored so the pipe keeps draining.
+    
+    Yields the deque of captured lines, complete once the block exits.
+    """
+    lines = deque(maxlen=max_lines)
+    read_fd, write_fd = os.pipe()
+    
+    def drain():
+        with os.fdopen(read_fd, 'r', encoding='utf-8', errors='replace') as pipe:
+            for line in pipe:
+                line = line.rstrip('\n')
+                lines.append(line)
+                if on_line is not None:
+                    try:
+                        on_line(line)
+                    except Exception:
+                        pass  # A dead drain thread would block the OCR child
+    
+    sys.stderr.flush()
+    saved_fd = os.dup(2)
+    reader = threading.Thread(target=drain, daemon=True)
+    reader.start()
+    try:
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        yield lines
+    finally:
+        sys.stderr.flush()
+        # Restoring fd 2 closes the last write end, so the reader sees EOF
+        os.dup2(saved_fd, 2)
+        os.close(saved_fd)
+        reader.join()
+
+# OCRmyPDF/Tesseract/Ghostscript stderr lines worth showing; progress bars
+# and other chatter are dropped
+DIAGNOSTIC_LINE = re.compile(r'\b(?:warn(?:ing)?|error|info)\b', re.IGNORECASE)
+
+FAILURE_TAIL_LINES = 20  # stderr lines kept to show when OCR fails
+
+def _print_diagnostic(line):
+    """redirect_stderr_fd() callback: echo warning/error/info lines to stdout"""
+    if DIAGNOSTIC_LINE.search(line):
+        print(f"  [DIAGNOSTICS] {line.strip()}")
+
+def _print_stderr_tail(lines):
+    """Show the last captured stderr lines, unfiltered, after a failed run"""
+    lines = [line for line in lines if line.strip()]
+    if lines:
+        print("  [DIAGNOSTICS] Last OCRmyPDF output:")
+        for line in lines:
+            print(f"    {line}")
+
+RAM_TEMPDIR = '/dev/shm'
+
+@contextlib.contextmanager
+def ram_tempdir(pdf_path, min_free=1 << 30, size_factor=20, parallel_files=1):
+    """
+    Keep OCRmyPDF's intermediate page images in RAM when there is room.
+    
+    OCRmyPDF rasterizes every page to an image file in its temporary folder
+    and Tesseract reads it back. On Linux, pointing the temp folder at the
+    /dev/shm tmpfs removes that disk round trip. It is used only when the
+    user has not chosen TMPDIR and /dev/shm has room for parallel_files
+    files being OCR'd at once, each assumed to need at least min_free bytes
+    and size_factor times the input size (containers often mount a 64 MB
+    /dev/shm); otherwise the normal temp folder is kept.
+    
+    The redirect sets tempfile.tempdir, which is process-wide: while the
+    block runs, temporary files created by other threads of this process
+    also go to /dev/shm.
+    """
+    saved = tempfile.tempdir
+    try:
+        per_file = max(min_free, size_factor * os.path.getsize(pdf_path))
+        use_ram = ('TMPDIR' not in os.environ
+                   and os.access(RAM_TEMPDIR, os.W_OK)
+                   and shutil.disk_usage(RAM_TEMPDIR).free >= per_file * max(1, parallel_files))
+    except OSError:
+        use_ram = False
+    if use_ram:
+        tempfile.tempdir = RAM_TEMPDIR
+    try:
+        yield
+    finally:
+        tempfile.tempdir = saved
+
+def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng', jobs=None,
+                       mode='skip', parallel_files=1, fast=False, output_type='pdfa',
+                       preparsed_info=None):
     """
     OCR a PDF just like Adobe Acrobat Pro
     Creates a searchable PDF with invisible text layer
@@ -105,13 +543,45 @@ def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
     Args:
         pdf_path: Path to input PDF
         output_path: Optional output path (defaults to overwriting input)
-        backup: Create backup before processing
+        backup: When OCRing in place, keep the original as <name>.pdf.backup
+            if the result fails verification. The original is only replaced
+            once OCR has finished, so a failed or interrupted run leaves it as
+            it was
         language: OCR language(s) - e.g., 'eng', 'spa', 'eng+spa' for multiple
+        jobs: OCRmyPDF worker count for this file (defaults to CPU count // parallel_files)
+        mode: 'skip' returns early if the PDF already has text or an OCR
+            producer tag; 'force' rasterizes and re-OCRs every page; 'redo'
+            replaces only an existing OCR text layer (much faster than force
+            on previously OCR'd files, but cannot deskew)
+        parallel_files: How many files the caller is OCRing concurrently,
+            used to split the CPU between them when jobs is not given and
+            to decide whether /dev/shm has room for all their page images
+        fast: Trade file size and PDF/A compliance for speed: no image
+            optimization (optimize=0), plain PDF output, no clean/deskew.
+            Roughly halves the post-OCR phase on large batches
+        output_type: OCRmyPDF output type when not in fast mode
+        preparsed_info: PdfInfo from scan_pdf() for this file; the 'skip'
+            check then uses it instead of opening the PDF again
+    
+    Temporary files: on Linux the page images go to /dev/shm when it has
+    room (see ram_tempdir). This sets tempfile.tempdir for the whole
+    process while OCRmyPDF runs.
+    
+    Threading: when OMP_THREAD_LIMIT is unset, OCRmyPDF already gives each
+    Tesseract process jobs // pages threads (1 to 3), so a lone file uses
+    the spare cores. Only process_directory()'s worker pool, where several
+    files share the CPU, pins Tesseract to one thread (see
+    _limit_tesseract_threads).
     """
+    if mode not in OCR_MODES:
+        raise ValueError(f"mode must be one of {OCR_MODES}, got {mode!r}")
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // max(1, parallel_files))
+    
+    tmp_path = None
+    stderr_lines = ()
     try:
         import ocrmypdf
-        import sys
-        from io import StringIO
         
         # Configure Tesseract path if needed
         if 'TESSERACT_PATH' in os.environ:
@@ -119,37 +589,64 @@ def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
             import pytesseract
             pytesseract.pytesseract.tesseract_cmd = os.environ['TESSERACT_PATH']
         
-        if not output_path:
-            output_path = pdf_path
+        pdf_path = Path(pdf_path)
+        output_path = Path(output_path) if output_path else pdf_path
+        input_path = pdf_path
+        
+        # Don't send searchable PDFs through Ghostscript + Tesseract again
+        if mode == 'skip':
+            if preparsed_info is not None:
+                ocrd = preparsed_info.has_text or preparsed_info.ocr_producer
+            else:
+                ocrd = already_ocrd(pdf_path)
+            if ocrd:
+                print("  [SKIP] Already OCR'd - use force or redo mode to OCR again")
+                return True
         
-        # Create backup if requested
-        if backup and output_path == pdf_path:
-            backup_path = pdf_path.with_suffix('.pdf.backup')
-            shutil.copy2(pdf_path, backup_path)
-            print(f"  [BACKUP] Created backup: {backup_path.name}")
+        # In-place OCR writes to a temporary file next to the original, which
+        # stays untouched until the result is moved over it. An interrupted
+        # or killed run therefore never loses the document.
+        in_place = output_path == pdf_path
+        if in_place:
+            tmp_path = output_path = pdf_path.with_suffix('.pdf.ocr-tmp')
         
         print(f"  [OCR] Processing with Adobe-style OCR (language: {language})...")
         
-        # Capture stderr for diagnostics
-        stderr_capture = StringIO()
-        old_stderr = sys.stderr
+        if mode == 'redo':
+            # Replace only the old OCR layer; OCRmyPDF rejects deskew here
+            mode_options = {'redo_ocr': True, 'deskew': False}
+        else:
+            mode_options = {
+                'deskew': True,              # Straighten scanned pages
+                'force_ocr': True,           # OCR even if text exists
+                'skip_text': False,          # Process all pages
+            }
+        
+        if fast:
+            # Skip the slow post-OCR stages (image re-optimization and PDF/A
+            # conversion) and the pre-OCR cleanup passes
+            quality_options = {'optimize': 0, 'output_type': 'pdf', 'clean': False}
+            mode_options['deskew'] = False
+        else:
+            quality_options = {
+                'optimize': 3,               # Maximum optimization for large color scans
+                'output_type': output_type,
+                'clean': True,               # Apply noise removal for better accuracy
+            }
         
-        try:
-            # Redirect stderr to capture diagnostics
-            sys.stderr = stderr_capture
-            
+        # Capture stderr (including Tesseract/Ghostscript) and stream the
+        # relevant diagnostics while OCR runs
+        with ram_tempdir(input_path, parallel_files=parallel_files), \
+                redirect_stderr_fd(FAILURE_TAIL_LINES, on_line=_print_diagnostic) as stderr_lines:
             # Run OCR with settings similar to Adobe Pro
             # Following best practices for reliable results
             result = ocrmypdf.ocr(
-                str(pdf_path),
+                str(input_path),
                 str(output_path),
                 # Adobe-like settings with enhanced reliability
                 rotate_pages=True,           # Auto-rotate pages
-                deskew=True,                 # Straighten scanned pages
-                clean=True,                  # Apply noise removal for better accuracy
-                force_ocr=True,              # OCR even if text exists
-                skip_text=False,             # Process all pages
-                optimize=3,                  # Maximum optimization for large color scans
+                **mode_options,
+                **quality_options,
                 language=language,           # Explicit language specification for better accuracy
                 # Quality settings
                 jpg_quality=85,              # Balanced quality/size ratio
@@ -158,32 +655,27 @@ def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
                 # Text settings
                 oversample=300,              # 300 DPI for best OCR accuracy
                 # remove_background=True,    # Not implemented in current version
+                jobs=jobs,                   # Page workers for this file
             )
-        finally:
-            # Restore stderr
-            sys.stderr = old_stderr
-            stderr_output = stderr_capture.getvalue()
-        
-        # Display stderr output if any (contains helpful diagnostics)
-        if stderr_output.strip():
-            print("  [DIAGNOSTICS] OCRmyPDF output:")
-            for line in stderr_output.strip().split('\n'):
-                if line.strip():
-                    print(f"    {line}")
         
         if result == ocrmypdf.ExitCode.ok:
             print("  [SUCCESS] Created searchable PDF like Adobe Pro!")
             
             # Verify it worked
-            if has_text(output_path):
+            verified = has_text(output_path)
+            if verified:
                 print("  [VERIFIED] PDF is now searchable")
-                
-                # Remove backup if successful
-                if backup and output_path == pdf_path and backup_path.exists():
-                    backup_path.unlink()
-                    print("  [CLEANUP] Removed backup")
             else:
                 print("  [WARNING] PDF may not be searchable")
+            
+            if in_place:
+                # Keep the original as a backup only if the result looks wrong
+                if backup and not verified:
+                    backup_path = pdf_path.with_suffix('.pdf.backup')
+                    link_or_copy(pdf_path, backup_path)
+                    print(f"  [BACKUP] Created backup: {backup_path.name}")
+                os.replace(tmp_path, pdf_path)
+                tmp_path = None
                 
             return True
         else:
@@ -206,17 +698,16 @@ def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
             
             if result in exit_codes:
                 print(f"  [ERROR DETAIL] {exit_codes[result]}")
+            _print_stderr_tail(stderr_lines)
             
-            # Restore backup if failed
-            if backup and output_path == pdf_path and backup_path.exists():
-                shutil.copy2(backup_path, pdf_path)
-                backup_path.unlink()
-                print("  [RESTORED] Restored from backup")
+            if in_place:
+                print("  [UNCHANGED] Original PDF left as it was")
                 
             return False
             
     except Exception as e:
         print(f"  [ERROR] {str(e)}")
+        _print_stderr_tail(stderr_lines)
         
         # Common errors and solutions
         if "tesseract" in str(e).lower():
@@ -226,74 +717,482 @@ def ocr_pdf_like_adobe(pdf_path, output_path=None, backup=True, language='eng'):
             print("\n  Note: 'unpaper' not required for basic OCR")
             
         return False
+    finally:
+        # Also runs on Ctrl+C; the original was never modified
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst (no data copied), copying where links fail"""
+    if os.path.exists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+# Tesseract engines of this process, by language; see _tesseract_api()
+_tesseract_apis = {}
+
+def _tesseract_api(language):
+    """One persistent PyTessBaseAPI per process and language"""
+    api = _tesseract_apis.get(language)
+    if api is None:
+        from tesserocr import PyTessBaseAPI, PSM
+        api = PyTessBaseAPI(lang=language, psm=PSM.AUTO)
+        atexit.register(api.End)
+        _tesseract_apis[language] = api
+    return api
+
+@lru_cache(maxsize=1)
+def _text_layer_font():
+    """
+    Font for the invisible text layer
+    
+    The base-14 Helvetica that insert_text() uses by default only encodes
+    Latin-1, so Cyrillic, Greek or CJK text would extract as dots. MuPDF's
+    built-in Droid Sans Fallback covers those scripts; ocr_pdf_fast()
+    subsets it before saving, so only the glyphs used are embedded.
+    """
+    return fitz.Font("cjk")
+
+def _add_text_layer(page, result_iterator, zoom):
+    """Write recognized text lines onto a PyMuPDF page as invisible text"""
+    from tesserocr import RIL, iterate_level
+    
+    if result_iterator is None:
+        return
+    font = _text_layer_font()
+    # Pixel coordinates of the rendered page -> unrotated PDF coordinates
+    to_page = fitz.Matrix(1 / zoom, 1 / zoom) * page.derotation_matrix
+    # Whole lines rather than words, so extracted text keeps its word order
+    for line in iterate_level(result_iterator, RIL.TEXTLINE):
+        text = line.GetUTF8Text(RIL.TEXTLINE)
+        box = line.BoundingBox(RIL.TEXTLINE)
+        if not box or not text or not text.strip():
+            continue
+        text = text.strip()
+        x0, y0, x1, y1 = box
+        fontsize = max(1.0, (y1 - y0) / zoom)
+        # Stretch the line horizontally to the recognized box, so selecting
+        # the text highlights the words on the page image
+        text_width = font.text_length(text, fontsize=fontsize)
+        scale = (x1 - x0) / zoom / text_width if text_width else 1.0
+        origin = fitz.Point(x0, y1) * to_page
+        writer = fitz.TextWriter(page.rect)
+        writer.append(origin, text, font=font, fontsize=fontsize)
+        writer.write_text(page, render_mode=3,  # 3 = invisible
+                          morph=(origin, fitz.Matrix(scale, 1) * fitz.Matrix(page.rotation)))
+
+def ocr_pdf_fast(pdf_path, language='eng', dpi=300, preparsed_info=None):
+    """
+    OCR a PDF in place using Tesseract's C++ API in this process
+    
+    OCRmyPDF starts a Tesseract process per page and each one reloads the
+    language model. Here one engine per process (see _tesseract_api) is
+    reused for every page and every file, pages are rendered by PyMuPDF and
+    the recognized words are added to the original pages as an invisible
+    text layer, so page content is not re-encoded. There is no deskew,
+    cleaning, optimization or PDF/A conversion.
+    
+    The result is saved to a temporary file and moved over the original with
+    os.replace, so no backup copy is needed.
+    
+    Existing text is never OCR'd again: files with a text layer or an OCR
+    producer tag are skipped, and in mixed files only the pages without
+    text get a layer. There is no equivalent of OCRmyPDF's force or redo
+    modes.
+    
+    Args:
+        pdf_path: Path to input PDF
+        language: Tesseract language(s), e.g. 'eng' or 'eng+spa'
+        dpi: Render resolution for recognition
+        preparsed_info: PdfInfo from scan_pdf() for this file, used for the
+            skip check instead of opening the PDF again
+    
+    Requires tesserocr and PyMuPDF. Returns True on success.
+    """
+    pdf_path = Path(pdf_path)
+    if preparsed_info is not None:
+        ocrd = preparsed_info.has_text or preparsed_info.ocr_producer
+    else:
+        ocrd = already_ocrd(pdf_path)
+    if ocrd:
+        print("  [SKIP] Already OCR'd - the tesserocr engine does not OCR existing text")
+        return True
+    
+    if fitz is None:
+        print("  [ERROR] Fast OCR needs PyMuPDF: pip install PyMuPDF")
+        return False
+    try:
+        from PIL import Image
+        api = _tesseract_api(language)
+    except (ImportError, RuntimeError) as e:
+        print(f"  [ERROR] Fast OCR needs tesserocr with '{language}' data: {e}")
+        return False
+    
+    tmp_path = pdf_path.with_suffix('.pdf.ocr-tmp')
+    zoom = dpi / 72
+    print(f"  [OCR] Processing with in-process Tesseract (language: {language})...")
+    try:
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                if page.get_text("text").strip():
+                    continue  # A second text layer would duplicate this text
+                # Grayscale straight from memory: a third of the RGB bytes,
+                # and Tesseract binarizes the image anyway
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom),
+                                      colorspace=fitz.csGRAY, alpha=False)
+                api.SetImage(Image.frombytes("L", (pix.width, pix.height), pix.samples))
+                api.SetSourceResolution(dpi)
+                api.Recognize()
+                _add_text_layer(page, api.GetIterator(), zoom)
+            doc.subset_fonts()
+            doc.save(tmp_path, garbage=3, deflate=True)
+        os.replace(tmp_path, pdf_path)
+    except Exception as e:
+        print(f"  [ERROR] {str(e)}")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        return False
+    
+    print("  [SUCCESS] Created searchable PDF")
+    return True
+
+def _ocr_one(pdf_path, mode, ocr_options, info=None):
+    """Worker entry point: OCR one file in place, never raising"""
+    options = dict(ocr_options)
+    engine = options.pop('engine', 'ocrmypdf')
+    try:
+        if engine == 'tesserocr':
+            return ocr_pdf_fast(pdf_path, language=options['language'],
+                                preparsed_info=info), None
+        return ocr_pdf_like_adobe(pdf_path, backup=True, mode=mode,
+                                  preparsed_info=info, **options), None
+    except Exception as e:
+        return False, str(e)
+
+def prefetch_file(pdf_path):
+    """
+    Ask the kernel to start reading a file into the page cache, without
+    waiting for it. No-op where posix_fadvise is unavailable (Windows, macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(pdf_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
 
-def process_directory(directory):
-    """Process all PDFs in directory that need OCR"""
+def _limit_tesseract_threads():
+    """
+    Process pool initializer: one OpenMP thread per Tesseract
+    
+    With several files OCR'd at once, Tesseract's OpenMP threads stack on
+    top of every file's page workers and oversubscribe the CPU. setdefault
+    keeps an explicit user setting.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+def _iter_ocr_results(pdf_paths, parallel_files, modes, ocr_options, infos=None):
+    """
+    OCR each path and yield (pdf_path, success, error) as files finish
+    
+    modes maps each path to the OCR mode for that file and infos (optional)
+    to its PdfInfo from the scan; ocr_options are the settings shared by
+    every file (see _ocr_one).
+    
+    With parallel_files > 1 the files are spread over a process pool (OCR
+    is CPU-bound in Tesseract, so threads would not help) and results arrive
+    in completion order. Otherwise files are processed in order in-process,
+    with the next file read ahead in the background while the current one
+    is being OCR'd.
+    """
+    total = len(pdf_paths)
+    infos = infos or {}
+    if parallel_files <= 1 or total <= 1:
+        for i, pdf_path in enumerate(pdf_paths, 1):
+            if i < total:
+                prefetch_file(pdf_paths[i])
+            print(f"\n[{i}/{total}] Processing: {pdf_path.name}")
+            print("-" * 60)
+            yield (pdf_path, *_ocr_one(pdf_path, modes[pdf_path], ocr_options, infos.get(pdf_path)))
+        return
+    
+    # Children inherit os.environ, including TESSERACT_PATH set by
+    # check_requirements() in this process
+    with ProcessPoolExecutor(max_workers=min(parallel_files, total),
+                             initializer=_limit_tesseract_threads) as executor:
+        futures = {executor.submit(_ocr_one, pdf_path, modes[pdf_path], ocr_options,
+                                   infos.get(pdf_path)): pdf_path
+                   for pdf_path in pdf_paths}
+        for i, future in enumerate(as_completed(futures), 1):
+            pdf_path = futures[future]
+            print(f"\n[{i}/{total}] Finished: {pdf_path.name}")
+            print("-" * 60)
+            try:
+                yield (pdf_path, *future.result())
+            except Exception as e:  # worker process died
+                yield pdf_path, False, str(e)
+
+def positive_int(value):
+    """argparse type for worker counts: an integer of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a whole number, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def process_directory(directory, dry_run=False, parallel_files=None, ocr_jobs=None,
+                      mode='skip', fast=False, engine='ocrmypdf'):
+    """
+    Process all PDFs in directory that need OCR
+    
+    This is the single batch implementation shared by ocr_pdfs.py and the
+    command line entry point of this module.
+    
+    Args:
+        directory: Folder to scan for PDFs
+        dry_run: Only report which PDFs would be OCR'd; no files are written
+            and the OCR toolchain is not required
+        parallel_files: Number of PDFs to OCR at once, each in its own process
+            (defaults to CPU count // ocr_jobs, or 1 when ocr_jobs is unset)
+        ocr_jobs: OCRmyPDF workers per file (defaults to CPU count // parallel_files)
+        mode: OCR mode passed to ocr_pdf_like_adobe() ('skip', 'force' or 'redo').
+            'force' and 'redo' OCR every PDF in the folder with that mode.
+            With the default 'skip', searchable PDFs are left alone and the
+            rest are classified with classify_pdf(): born-digital files are
+            skipped, scans get 'force' and mixed files get 'redo'
+        fast: Use ocr_pdf_like_adobe()'s fast mode for every file
+        engine: 'ocrmypdf' (ocr_pdf_like_adobe) or 'tesserocr' (ocr_pdf_fast,
+            one Tesseract engine per worker process reused across files;
+            skip mode only, never OCRs pages that already have text)
+    
+    Keep parallel_files * ocr_jobs close to the CPU thread count; more
+    oversubscribes the cores, fewer leaves them idle.
+    """
+    if engine == 'tesserocr' and mode != 'skip':
+        raise ValueError("The tesserocr engine only supports mode='skip'")
+    for name, count in (('parallel_files', parallel_files), ('ocr_jobs', ocr_jobs)):
+        if count is not None and count < 1:
+            raise ValueError(f"{name} must be at least 1, got {count}")
+    cpu_count = os.cpu_count() or 1
+    if parallel_files is None:
+        parallel_files = max(1, cpu_count // ocr_jobs) if ocr_jobs else 1
+    if ocr_jobs is None and parallel_files > 1:
+        ocr_jobs = max(1, cpu_count // parallel_files)
+    
     target_dir = Path(directory)
     
     print(f"\n{'='*60}")
-    print("ADOBE-STYLE OCR FOR SEARCHABLE PDFS")
+    print("OCR PROCESSING - PDF BATCH PROCESSOR")
     print(f"{'='*60}")
     print(f"Directory: {target_dir}\n")
     
-    # Check requirements first
-    if not check_requirements():
+    # Check requirements first (a dry run never invokes the OCR toolchain)
+    if not dry_run and not check_requirements():
+        print("\n[ERROR] Missing requirements. Please install Tesseract OCR.")
+        return
+    
+    # Check if directory exists
+    if not target_dir.exists():
+        print(f"\n[ERROR] Directory not found: {target_dir}")
+        return
+    
+    print("\nScanning for PDFs...\n")
+    
+    # Find all PDFs
+    pdf_files = list(target_dir.glob("*.pdf"))
+    
+    if not pdf_files:
+        print("\n[ERROR] No PDF files found in directory")
         return
     
-    print("\nScanning for PDFs without searchable text...\n")
+    print(f"Found {len(pdf_files)} PDF files\n")
     
-    # Find PDFs needing OCR
+    # Check which PDFs need OCR
     pdfs_to_process = []
+    already_searchable = []
+    modes = {}
+    infos = {}
+    cache_path = target_dir / TEXT_CACHE_NAME
+    text_cache = load_text_cache(cache_path)
+    seen_entries = {}
     
-    for pdf_file in target_dir.glob("*.pdf"):
-        if pdf_file.name.endswith('.backup'):
-            continue
+    try:
+        for pdf_file in pdf_files:
+            if pdf_file.name.endswith('.backup'):
+                continue
+                
+            print(f"Checking: {pdf_file.name}...", end=" ")
             
-        if has_text(pdf_file):
-            print(f"[SKIP] {pdf_file.name} - Already searchable")
-        else:
-            print(f"[NEED OCR] {pdf_file.name} - No searchable text")
-            pdfs_to_process.append(pdf_file)
+            # One open per file answers text layer, producer and class
+            info = cached_scan_pdf(pdf_file, text_cache, seen_entries)
+            if info is None:
+                print("[WARNING] Could not access file - skipped")
+                continue
+            infos[pdf_file] = info
+            if mode != 'skip':
+                # force/redo are explicit requests to OCR text layers again
+                modes[pdf_file] = mode
+                print(f"Needs OCR ({mode} mode)")
+                pdfs_to_process.append(pdf_file)
+                continue
+            
+            if info.has_text:
+                print("Already searchable")
+                already_searchable.append(pdf_file)
+                continue
+            if info.ocr_producer:
+                print("Already OCR'd (producer metadata)")
+                already_searchable.append(pdf_file)
+                continue
+            
+            kind = info.kind
+            if kind == 'digital':
+                print("Already searchable (born-digital)")
+                already_searchable.append(pdf_file)
+            elif kind:
+                modes[pdf_file] = CLASSIFIED_MODES[kind]
+                print(f"Needs OCR ({kind} - {modes[pdf_file]} mode)")
+                pdfs_to_process.append(pdf_file)
+            else:
+                modes[pdf_file] = mode
+                print("Needs OCR")
+                pdfs_to_process.append(pdf_file)
+    finally:
+        # Also runs on Ctrl+C, so an interrupted scan keeps its progress
+        if not dry_run:
+            save_text_cache(cache_path, seen_entries)
+    
+    print(f"\n{'='*60}")
+    print(f"Summary:")
+    print(f"  - Total PDFs: {len(pdf_files)}")
+    print(f"  - Already searchable: {len(already_searchable)}")
+    print(f"  - Need OCR: {len(pdfs_to_process)}")
+    page_counts = [infos[pdf_file].pages for pdf_file in pdfs_to_process]
+    if pdfs_to_process and None not in page_counts:
+        print(f"  - Pages to OCR: {sum(page_counts)}")
+    print(f"{'='*60}\n")
     
     if not pdfs_to_process:
-        print("\nAll PDFs are already searchable!")
+        print("All PDFs are already searchable!")
         return
     
-    print(f"\n{'='*60}")
-    print(f"Creating {len(pdfs_to_process)} searchable PDFs (like Adobe Pro)")
-    print(f"{'='*60}\n")
+    if dry_run:
+        print("[DRY RUN] No files were modified. PDFs that would be OCR'd:")
+        for pdf_file in pdfs_to_process:
+            print(f"  - {pdf_file.name}")
+        return
+    
+    # Process PDFs that need OCR
+    print(f"Starting OCR processing for {len(pdfs_to_process)} PDFs...\n")
+    if parallel_files > 1:
+        print(f"Running {parallel_files} files at a time, {ocr_jobs} OCR jobs each\n")
     
     success_count = 0
+    failed_files = []
     
-    for i, pdf_path in enumerate(pdfs_to_process, 1):
-        print(f"[{i}/{len(pdfs_to_process)}] Processing: {pdf_path.name}")
-        
-        if ocr_pdf_like_adobe(pdf_path):
+    # Byte-identical scans are OCR'd once and the result copied to the rest
+    groups = group_duplicates(pdfs_to_process)
+    if len(groups) < len(pdfs_to_process):
+        print(f"Skipping OCR for {len(pdfs_to_process) - len(groups)} duplicate PDFs\n")
+    
+    ocr_options = {'language': 'eng', 'jobs': ocr_jobs, 'fast': fast, 'engine': engine,
+                   'parallel_files': parallel_files}
+    results = _iter_ocr_results(list(groups), parallel_files, modes, ocr_options, infos)
+    for pdf_path, success, error in results:
+        duplicates = groups[pdf_path]
+        if success:
             success_count += 1
-        
-        print()  # Blank line between files
+            print(f"  [SUCCESS] OCR completed for: {pdf_path.name}")
+            failed_copies = copy_to_duplicates(pdf_path, duplicates)
+            success_count += len(duplicates) - len(failed_copies)
+            failed_files.extend(Path(d).name for d in failed_copies)
+        else:
+            failed_files.append(pdf_path.name)
+            failed_files.extend(Path(d).name for d in duplicates)
+            if error:
+                print(f"  [ERROR] Exception processing {pdf_path.name}: {error}")
+            else:
+                print(f"  [FAILED] Could not OCR: {pdf_path.name}")
     
+    # Final summary
+    print(f"\n{'='*60}")
+    print("OCR PROCESSING COMPLETE")
     print(f"{'='*60}")
-    print(f"COMPLETE: {success_count}/{len(pdfs_to_process)} PDFs now searchable")
-    print(f"{'='*60}")
+    print(f"  - Successfully processed: {success_count}/{len(pdfs_to_process)}")
+    print(f"  - Already searchable: {len(already_searchable)}")
+    print(f"  - Failed: {len(failed_files)}")
+    
+    if failed_files:
+        print("\nFailed files:")
+        for file in failed_files:
+            print(f"  - {file}")
     
-    if success_count > 0:
-        print("\nYour PDFs now have invisible text layers, just like Adobe Pro!")
-        print("You can search, copy text, and use them with any PDF reader.")
+    print(f"\n{'='*60}")
+    print("All successfully processed PDFs now have searchable text layers!")
+    print("You can search, copy text, and use them with any PDF reader.")
+    print(f"{'='*60}")
 
 def main():
-    if len(sys.argv) > 1:
-        if sys.argv[1].endswith('.pdf'):
-            # Single file
-            pdf_path = Path(sys.argv[1])
-            print(f"\nProcessing single file: {pdf_path.name}")
-            ocr_pdf_like_adobe(pdf_path)
+    parser = argparse.ArgumentParser(description="Adobe-style OCR for PDFs without searchable text")
+    parser.add_argument('path', nargs='?', default=str(Path.cwd()),
+                        help='PDF file or folder to process (defaults to the current directory)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Report which PDFs would be OCR'd without modifying any files")
+    parser.add_argument('--parallel-files', type=positive_int, default=None,
+                        help='PDFs to OCR at once in separate processes (default: CPU count // --ocr-jobs, else 1)')
+    parser.add_argument('--ocr-jobs', type=positive_int, default=None,
+                        help='OCRmyPDF workers per file (default: CPU count // --parallel-files)')
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument('--force-ocr', dest='mode', action='store_const', const='force',
+                            help='Rasterize and OCR every page even if text already exists')
+    mode_group.add_argument('--redo-ocr', dest='mode', action='store_const', const='redo',
+                            help='Replace an existing OCR text layer instead of re-rasterizing')
+    parser.set_defaults(mode='skip')
+    parser.add_argument('--fast', action='store_true',
+                        help='Skip image optimization, PDF/A conversion and cleanup for speed')
+    parser.add_argument('--engine', choices=OCR_ENGINES, default='ocrmypdf',
+                        help='ocrmypdf (default) or tesserocr: in-process Tesseract, no '
+                             'per-page model reload, text layer only; only OCRs pages '
+                             'without text, so --force-ocr/--redo-ocr do not apply')
+    args = parser.parse_args()
+    if args.engine == 'tesserocr' and args.mode != 'skip':
+        parser.error("--force-ocr and --redo-ocr are not supported with --engine tesserocr")
+    
+    if args.path.endswith('.pdf'):
+        # Single file
+        pdf_path = Path(args.path)
+        print(f"\nProcessing single file: {pdf_path.name}")
+        if args.dry_run:
+            # Same decision as the real run: force/redo always OCR, skip
+            # leaves text layers and OCR producer tags alone
+            info = scan_pdf(pdf_path)
+            if args.mode != 'skip':
+                status = f"Needs OCR ({args.mode} mode)"
+            elif info.has_text:
+                status = "Already searchable"
+            elif info.ocr_producer:
+                status = "Already OCR'd (producer metadata)"
+            else:
+                status = "Needs OCR"
+            print(f"[DRY RUN] {status} - no changes made")
+        elif args.engine == 'tesserocr':
+            ocr_pdf_fast(pdf_path)
         else:
-            # Directory
-            process_directory(sys.argv[1])
+            ocr_pdf_like_adobe(pdf_path, jobs=args.ocr_jobs, mode=args.mode, fast=args.fast)
     else:
-        # Default to current working directory for universal usage
-        process_directory(Path.cwd())
+        # Directory (defaults to current working directory for universal usage)
+        process_directory(args.path, dry_run=args.dry_run,
+                          parallel_files=args.parallel_files, ocr_jobs=args.ocr_jobs,
+                          mode=args.mode, fast=args.fast, engine=args.engine)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,29 +4,139 @@ Verify that AI models can read OCR'd PDFs by comparing before/after.
 
 Usage:
     python -m src.validators.verify_ai_readable --original <path> --ocr <path> [--out results.json]
+    python -m src.validators.verify_ai_readable --original <path> --ocr <path> --out -
 
 If paths aren't provided, exits with usage info.
 """
 
 import PyPDF2
+import re
+import sys
 import json
 import argparse
-from datetime import datetime
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
-def extract_text_from_pdf(pdf_path):
-    """Extract all text from a PDF"""
+try:
+    import pdftotext  # Optional: poppler-based extraction
+except ImportError:
+    pdftotext = None
+
+try:
+    import pymupdf as fitz
+except ImportError:
     try:
+        import fitz  # PyMuPDF < 1.24.3
+    except ImportError:
+        fitz = None
+
+try:
+    import orjson  # Optional: faster JSON output
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # Optional: single-pass phrase matching
+except ImportError:
+    ahocorasick = None
+
+# Key phrases, matched case-insensitively (casefold also covers non-ASCII
+# OCR output such as German sharp s)
+_KEY_PHRASES = (
+    "IMPORTANT BUSINESS DOCUMENT",
+    "Quarterly Performance Report",
+    "Revenue",
+    "Customer Base",
+    "Market Share",
+    "Key Achievements",
+    "Future Outlook",
+)
+
+# Business metrics, people and dates, pulled out in a single regex pass.
+# Each metric needs its label earlier in the same sentence (at most 40
+# characters before the figure), so unrelated figures such as growth or error
+# rates are not picked up. Add new fields as another named alternative.
+_METRICS = re.compile(r"""
+    revenue\b[^.\n]{0,40}?\$?(?<![\d.,])(?P<revenue>\d+(?:\.\d+)?)\s*million
+  | customer\s+base\b[^.\n]{0,40}?(?<![\d.,])(?P<customers>\d{1,3}(?:,\d{3})+|\d+)
+        (?:\s+(?P<customer_label>(?:active\s+)?(?:users|customers)))?
+  | (?P<users>\d{1,3}(?:,\d{3})+|\d{4,})\s+(?P<user_label>(?:active\s+)?(?:users|customers))
+  | market\s+share\b[^.\n]{0,40}?(?<![\d.,])(?P<share>\d+(?:\.\d+)?%)
+  | (?P<person>John\s+Smith)
+  | (?P<date>(?:January|February|March|April|May|June|July|August|September
+               |October|November|December)\s+\d{1,2},\s*\d{4})
+""", re.VERBOSE | re.IGNORECASE)
+
+def _build_automaton(words):
+    """Compile words into an Aho-Corasick automaton that yields each match"""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+_FOLDED_KEY_PHRASES = tuple(p.casefold() for p in _KEY_PHRASES)
+_MIN_PHRASE_CHARS = min(len(p) for p in _FOLDED_KEY_PHRASES)
+
+if ahocorasick is not None:
+    _PHRASE_AUTOMATON = _build_automaton(_FOLDED_KEY_PHRASES)
+else:
+    _PHRASE_AUTOMATON = None
+
+def _find_all(text, words, automaton):
+    """Return the subset of words that occur in text, in one pass when possible"""
+    if automaton is None:
+        return {word for word in words if word in text}
+    return {word for _, word in automaton.iter(text)}
+
+def _page_texts(pdf_path):
+    """
+    Yield the text of each page with the fastest extractor available.
+    
+    poppler (pdftotext) and PyMuPDF parse content streams in C and are an
+    order of magnitude faster than PyPDF2's pure-Python interpreter, which
+    remains the fallback.
+    """
+    if pdftotext is not None:
         with open(pdf_path, 'rb') as f:
+            yield from pdftotext.PDF(f)
+    elif fitz is not None:
+        with fitz.open(pdf_path) as doc:
+            for page in doc:
+                yield page.get_text()
+    else:
+        # 1 MiB buffer: PyPDF2 issues many small reads on image-heavy PDFs
+        with open(pdf_path, 'rb', buffering=1 << 20) as f:
             reader = PyPDF2.PdfReader(f)
-            text = ""
-            for page_num, page in enumerate(reader.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    text += f"--- Page {page_num + 1} ---\n{page_text}\n"
-            return text.strip() if text else None
+            for page in reader.pages:
+                yield page.extract_text()
+
+def extract_text_from_pdf(pdf_path):
+    """Extract all text from a PDF"""
+    try:
+        # Collect pages and join once; += would recopy the text every page
+        parts = [
+            f"--- Page {page_num + 1} ---\n{page_text}\n"
+            for page_num, page_text in enumerate(_page_texts(pdf_path))
+            if page_text
+        ]
+        return "".join(parts).strip() if parts else None
     except Exception as e:
         return f"ERROR: {e}"
 
+def _json_default(value):
+    """json fallback for the datetimes orjson serializes natively"""
+    if isinstance(value, datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def dump_results(results):
+    """Serialize results as indented JSON bytes, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z)
+    return json.dumps(results, indent=2, default=_json_default).encode('utf-8')
+
 def analyze_content(text):
     """Analyze what content can be extracted"""
     if not text:
@@ -44,36 +154,39 @@ def analyze_content(text):
     people = []
     dates = []
     
+    # One scan for all key phrases over a single case-folded copy; text
+    # shorter than every phrase is not folded or scanned at all
+    if len(text) < _MIN_PHRASE_CHARS:
+        found_phrases = set()
+    else:
+        found_phrases = _find_all(text.casefold(), _FOLDED_KEY_PHRASES, _PHRASE_AUTOMATON)
+    
     # Look for key phrases
-    key_phrases = [
-        "IMPORTANT BUSINESS DOCUMENT",
-        "Quarterly Performance Report",
-        "Revenue",
-        "Customer Base",
-        "Market Share",
-        "Key Achievements",
-        "Future Outlook"
-    ]
-    
-    for phrase in key_phrases:
-        if phrase.lower() in text.lower():
+    for phrase, folded_phrase in zip(_KEY_PHRASES, _FOLDED_KEY_PHRASES):
+        if folded_phrase in found_phrases:
             content_found.append(phrase)
     
-    # Extract business metrics
-    if "revenue" in text.lower() and "12.5 million" in text:
-        business_metrics["Revenue"] = "$12.5 million"
-    if "45,000" in text or "45000" in text:
-        business_metrics["Customer Base"] = "45,000 active users"
-    if "18.5%" in text:
-        business_metrics["Market Share"] = "18.5%"
-    
-    # Extract people
-    if "John Smith" in text:
-        people.append("John Smith (CEO)")
-    
-    # Extract dates
-    if "November 15, 2024" in text or "November  15, 2024" in text:
-        dates.append("November 15, 2024")
+    # Extract business metrics, people and dates (first value of each wins)
+    metrics = {}
+    for match in _METRICS.finditer(text):
+        if match['revenue']:
+            metrics.setdefault("Revenue", f"${match['revenue']} million")
+        elif match['customers'] or match['users']:
+            count = int((match['customers'] or match['users']).replace(',', ''))
+            label = match['customer_label'] or match['user_label'] or 'customers'
+            label = ' '.join(label.lower().split())
+            metrics.setdefault("Customer Base", f"{count:,} {label}")
+        elif match['share']:
+            metrics.setdefault("Market Share", match['share'])
+        elif match['person'] and "John Smith (CEO)" not in people:
+            people.append("John Smith (CEO)")
+        elif match['date']:
+            date = ' '.join(match['date'].split())
+            if date not in dates:
+                dates.append(date)
+    for name in ("Revenue", "Customer Base", "Market Share"):
+        if name in metrics:
+            business_metrics[name] = metrics[name]
     
     return {
         "readable": True,
@@ -88,19 +201,46 @@ def main():
     parser = argparse.ArgumentParser(description="Verify AI readability of PDFs (before vs after OCR)")
     parser.add_argument('--original', required=True, help='Path to original (pre-OCR) PDF')
     parser.add_argument('--ocr', required=True, help="Path to OCR'd (post-OCR) PDF")
-    parser.add_argument('--out', default='ai_readability_test_results.json', help='Path to write JSON results')
+    parser.add_argument('--out', default='ai_readability_test_results.json',
+                        help="Path to write JSON results ('-' prints them to stdout instead)")
     args = parser.parse_args()
 
-    original_pdf = args.original
-    ocr_pdf = args.ocr
+    # With --out - stdout carries only the JSON; the report goes to stderr
+    report_stream = sys.stderr if args.out == '-' else sys.stdout
+    with contextlib.redirect_stdout(report_stream):
+        results = run_verification(args.original, args.ocr)
+    
+    data = dump_results(results)
+    if args.out == '-':
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n")
+        return
+    
+    with open(args.out, 'wb') as f:
+        f.write(data)
+    
+    print(f"\nResults saved to: {args.out}")
 
+def run_verification(original_pdf, ocr_pdf):
+    """Print the before/after readability report and return the results"""
     print("\n" + "="*60)
     print("AI READABILITY VERIFICATION TEST")
     print("="*60)
 
+    if pdftotext is not None:
+        # poppler releases the GIL, so both extractions can run at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            original_future = executor.submit(extract_text_from_pdf, original_pdf)
+            ocr_future = executor.submit(extract_text_from_pdf, ocr_pdf)
+            original_text, ocr_text = original_future.result(), ocr_future.result()
+    else:
+        # PyMuPDF is initialized for single-threaded use and PyPDF2 holds
+        # the GIL, so extract one after the other
+        original_text = extract_text_from_pdf(original_pdf)
+        ocr_text = extract_text_from_pdf(ocr_pdf)
+
     print("\n1. TESTING ORIGINAL SCANNED PDF (Before OCR)")
     print("-" * 50)
-    original_text = extract_text_from_pdf(original_pdf)
     original_analysis = analyze_content(original_text)
     
     print(f"File: {original_pdf}")
@@ -113,7 +253,6 @@ def main():
     
     print("\n2. TESTING OCR'D PDF (After OCR)")
     print("-" * 50)
-    ocr_text = extract_text_from_pdf(ocr_pdf)
     ocr_analysis = analyze_content(ocr_text)
     
     print(f"File: {ocr_pdf}")
@@ -165,9 +304,8 @@ def main():
     print("  - Analyze document content")
     print("  - Answer questions about the document")
     
-    # Save results
-    results = {
-        "test_date": datetime.utcnow().isoformat() + 'Z',
+    return {
+        "test_date": datetime.now(timezone.utc),
         "original_pdf": {
             "readable": original_analysis['readable'],
             "text_found": bool(original_text)
@@ -181,11 +319,6 @@ def main():
         },
         "conclusion": "OCR successfully converts non-readable PDFs to AI-readable format"
     }
-    
-    with open(args.out, 'w') as f:
-        json.dump(results, f, indent=2)
-    
-    print(f"\nResults saved to: {args.out}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file